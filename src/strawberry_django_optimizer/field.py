@@ -6,13 +6,18 @@ from .query import optimize_query
 
 
 class OptimizedStrawberryDjangoField(StrawberryDjangoField):
+    def __init__(self, *args, use_values_list=False, **kwargs):
+        self.use_values_list = use_values_list
+        super().__init__(*args, **kwargs)
+
     def get_queryset(self, queryset, info, **kwargs):
         queryset = super().get_queryset(queryset, info, **kwargs)
         record_type = unwrap_type(self.type)
-        return optimize_query(queryset, info=info, gql_type=record_type)
+        return optimize_query(queryset, info=info, gql_type=record_type, use_values_list=self.use_values_list)
 
 
-def optimized_django_field(resolver=None, *, name=None, field_name=None, filters=UNSET, default=UNSET, **kwargs):
+def optimized_django_field(resolver=None, *, name=None, field_name=None, filters=UNSET, default=UNSET,
+                           use_values_list=False, **kwargs):
     field_ = OptimizedStrawberryDjangoField(
         python_name=None,
         graphql_name=name,
@@ -20,6 +25,7 @@ def optimized_django_field(resolver=None, *, name=None, field_name=None, filters
         filters=filters,
         django_name=field_name,
         default=default,
+        use_values_list=use_values_list,
         **kwargs
     )
     if resolver:
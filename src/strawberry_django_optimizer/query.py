@@ -6,7 +6,10 @@ from strawberry.lazy_type import LazyType
 from strawberry.types.nodes import SelectedField, FragmentSpread, InlineFragment
 from strawberry.utils.str_converters import to_camel_case
 from django.core.exceptions import FieldDoesNotExist
-from django.db.models import ForeignKey, QuerySet
+from django.db.models import (
+    BooleanField, CharField, DateField, DecimalField, DurationField, FloatField, ForeignKey,
+    GenericIPAddressField, IntegerField, QuerySet, TextField, TimeField, UUIDField,
+)
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.reverse_related import ManyToOneRel
 
@@ -18,6 +21,23 @@ from .utils import is_iterable
 
 _logger = logging.getLogger(__name__)
 
+# Model fields whose attribute on the model instance is the raw column value,
+# so they can be read from `values_list()` rows as well.
+# Subclasses (e.g. AutoField, DateTimeField, EmailField) are included.
+_PLAIN_COLUMN_FIELDS = (
+    BooleanField,
+    CharField,
+    DateField,
+    DecimalField,
+    DurationField,
+    FloatField,
+    GenericIPAddressField,
+    IntegerField,
+    TextField,
+    TimeField,
+    UUIDField,
+)
+
 
 def optimize_query(queryset: QuerySet, info: Info, gql_type, selections: List[Selection] = None, **options):
     """
@@ -30,6 +50,9 @@ def optimize_query(queryset: QuerySet, info: Info, gql_type, selections: List[Se
         - **options - optimization options/settings
             - disable_abort_only (boolean) - in case the objecttype contains any extra fields,
                                              then this will keep the "only" optimization enabled.
+            - use_values_list (boolean) - if all selected fields are plain model columns, evaluate the
+                                          queryset with `values_list(named=True)` instead of building
+                                          model instances.
     """
     if not selections:
         selections = info.selected_fields[0].selections
@@ -44,6 +67,7 @@ class QueryOptimizer:
     def __init__(self, info: Info, **options):
         self.root_info = info
         self.disable_abort_only = options.pop('disable_abort_only', False)
+        self.use_values_list = options.pop('use_values_list', False)
 
     def optimize(self, queryset: QuerySet, selections: List[Selection], gql_type):
         store = self._optimize_gql_selections(selections, gql_type)
@@ -51,6 +75,9 @@ class QueryOptimizer:
         _logger.info('disable_abort_only: %r', store.disable_abort_only)
         _logger.info('select_list: %r', store.select_list)
         _logger.info('prefetch_list: %r', store.prefetch_list)
+        if self.use_values_list and store.can_use_values_list():
+            _logger.info('values_list: %r', store.only_list)
+            return store.values_list_queryset(queryset)
         return store.optimize_queryset(queryset)
 
     def _get_type(self, field_def):
@@ -122,6 +149,7 @@ class QueryOptimizer:
                 # Inline Fragment e.g. `... on Droid {}`
                 # ToDo
                 # self.handle_inline_fragment(selected_field, schema, possible_types, store)
+                store.columns_only = False
                 continue
             name = selected_field.name
             if name == '__typename':
@@ -129,12 +157,16 @@ class QueryOptimizer:
             if type(selected_field) is FragmentSpread:
                 self._optimize_gql_selections(selected_field.selections, graphql_type, store=store)
                 continue
+            if selected_field.alias:
+                store.columns_only = False
+            optimized = False
             for type_ in possible_types:
                 if isinstance(type_, LazyType):
                     type_ = type_.resolve_type()
                 if selected_field.name == 'rows' and selected_field.selections:
                     # Cursor pagination - optimize the selected fields in `rows`
                     self._optimize_gql_selections(selected_field.selections, graphql_type, store=store)
+                    optimized = True
                     continue
                 selection_field_def = next(
                     (field for field in type_._type_definition.fields if to_camel_case(field.name) == name),
@@ -142,9 +174,14 @@ class QueryOptimizer:
                 if not selection_field_def:
                     continue
                 model = type_._django_type.model
-                if model and name not in optimized_fields_by_model:
-                    optimized_fields_by_model[name] = model
-                    self._optimize_field(store, model, selected_field, selection_field_def, type_)
+                if model:
+                    optimized = True
+                    if name not in optimized_fields_by_model:
+                        optimized_fields_by_model[name] = model
+                        self._optimize_field(store, model, selected_field, selection_field_def, type_)
+            if not optimized:
+                # the resolver of a field that can't be mapped may read anything from the model instance
+                store.columns_only = False
         return store
 
     def _optimize_field(self, store: QueryOptimizerStore, model, selection, field_def, parent_type):
@@ -152,6 +189,28 @@ class QueryOptimizer:
         optimized_by_hints = self._optimize_field_by_hints(store, selection, field_def)
         if not (optimized_by_name or optimized_by_hints):
             store.abort_only_optimization()
+        if not self._is_plain_column(model, selection, field_def):
+            store.columns_only = False
+
+    def _is_plain_column(self, model, selection, field_def) -> bool:
+        """
+        Check if the field is resolved by reading a model column that is also available on `values_list()` rows.
+        """
+        if (
+            selection.selections
+            or getattr(field_def, 'base_resolver', None) is not None
+            or getattr(field_def, 'optimization_hints', None)
+        ):
+            # object types (e.g. files) and custom resolvers need the model instance
+            return False
+        name = self._get_name_from_field_dev(field_def)
+        if (getattr(field_def, 'django_name', None) or field_def.name) != name:
+            return False
+        if not (model_field := self._get_model_field_from_name(model, name)):
+            return False
+        if self._is_foreign_key_id(model_field, name):
+            return True
+        return isinstance(model_field, _PLAIN_COLUMN_FIELDS) and model_field.attname == name
 
     def _optimize_field_by_name(self, store: QueryOptimizerStore, model, selection, field_def) -> bool:
         """
@@ -15,6 +15,8 @@ class QueryOptimizerStore:
         self.prefetch_list = []
         self.only_list = []
         self.disable_abort_only = disable_abort_only
+        # True as long as every selected field resolves to a plain column of the model
+        self.columns_only = True
 
     def select_related(self, name, store: 'QueryOptimizerStore'):
         if store.select_list:
@@ -70,9 +72,27 @@ class QueryOptimizerStore:
 
         return queryset
 
+    def can_use_values_list(self):
+        """
+        Whether the selection can be resolved from `values_list()` rows without model instances.
+        """
+        return (
+            self.columns_only
+            and bool(self.only_list)
+            and not self.select_list
+            and not self.prefetch_list
+        )
+
+    def values_list_queryset(self, queryset):
+        """
+        Evaluate the selected columns as `Row` namedtuples instead of model instances.
+        """
+        return queryset.values_list(*dict.fromkeys(self.only_list), named=True)
+
     def append(self, store: 'QueryOptimizerStore'):
         self.select_list += store.select_list
         self.prefetch_list += store.prefetch_list
+        self.columns_only = self.columns_only and store.columns_only
         if self.only_list is not None:
             if store.only_list is None:
                 self.only_list = None
@@ -2,7 +2,16 @@ from django.db import models
 
 
 class Fruit(models.Model):
+    ORIGINS = (
+        ('eu', 'Europe'),
+        ('sa', 'South America'),
+    )
+
     name = models.CharField(max_length=20)
+    label = models.CharField(max_length=20, blank=True)
+    weight = models.IntegerField(default=0)
+    origin = models.CharField(max_length=2, choices=ORIGINS, default='eu')
+    picture = models.FileField(upload_to='fruits', blank=True)
     color = models.ForeignKey('Color', blank=True, null=True,
                               related_name='fruits', on_delete=models.CASCADE)
 
@@ -1,7 +1,7 @@
 import strawberry
 from strawberry.django import auto
-from strawberry_django_optimizer import optimized_django_field
-from typing import List
+from strawberry_django_optimizer import optimized_django_field, resolver_hints
+from typing import List, Optional
 from fruits import models
 
 
@@ -9,7 +9,20 @@ from fruits import models
 class Fruit:
     id: auto
     name: auto
+    picture: auto
     color: 'Color'
+    color_id: Optional[int]
+    weight: int = strawberry.django.field(name='mass')
+    label: str = strawberry.django.field(field_name='name')
+
+    @strawberry.field
+    def origin(self) -> str:
+        return self.get_origin_display()
+
+    @resolver_hints(only=('name',))
+    @strawberry.field
+    def name_display(self) -> str:
+        return f'My name is: {self.name}'
 
 
 @strawberry.django.type(models.Color)
@@ -23,6 +36,7 @@ class Color:
 class Query:
     fruits: List[Fruit] = strawberry.django.field()
     optimized_fruits: List[Fruit] = optimized_django_field()
+    values_list_fruits: List[Fruit] = optimized_django_field(use_values_list=True)
     colors: List[Color] = strawberry.django.field()
     optimized_colors: List[Color] = optimized_django_field()
 
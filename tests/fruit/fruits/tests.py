@@ -1,8 +1,10 @@
 import json
 import pytest
 from django.db import connection
+from django.db.models.query import NamedValuesListIterable
 from django.test.utils import CaptureQueriesContext
 from fruits.models import Fruit, Color
+from strawberry_django_optimizer import field as optimizer_field, optimize_query
 
 pytestmark = pytest.mark.django_db
 
@@ -20,6 +22,27 @@ def db_fixture(db):
     return Fruit.objects.count(), Color.objects.count()
 
 
+@pytest.fixture()
+def optimized_querysets(monkeypatch):
+    """Collect the querysets returned by `optimize_query` for `optimized_django_field`s."""
+    querysets = []
+
+    def capture_optimize_query(*args, **kwargs):
+        queryset = optimize_query(*args, **kwargs)
+        querysets.append(queryset)
+        return queryset
+
+    monkeypatch.setattr(optimizer_field, 'optimize_query', capture_optimize_query)
+    return querysets
+
+
+def assert_values_list_fallback(response, optimized_querysets):
+    """Assert that the query succeeded and was resolved from model instances."""
+    assert 'errors' not in response.json()
+    queryset, = optimized_querysets
+    assert all(isinstance(row, Fruit) for row in queryset)
+
+
 def test_fruits(client, db_fixture):
     fruit_count, color_count = db_fixture
     query = """
@@ -105,3 +128,188 @@ def test_optimized_colors(client, db_fixture):
         colors = response.json()['data']['optimizedColors']
         assert len(colors) == color_count
         assert len(connection.queries) == 2
+
+
+def test_values_list_fruits(client, db_fixture, optimized_querysets):
+    """Test that a list query selecting only columns is evaluated with `values_list`."""
+    fruit_count, _ = db_fixture
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            name
+        }
+    }
+    """
+    with CaptureQueriesContext(connection):
+        response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+        fruits = response.json()['data']['valuesListFruits']
+        assert len(fruits) == fruit_count
+        assert {fruit['name'] for fruit in fruits} == set(Fruit.objects.values_list('name', flat=True))
+        assert len(connection.queries) == 1
+    queryset, = optimized_querysets
+    assert queryset._iterable_class is NamedValuesListIterable
+    assert not any(isinstance(row, Fruit) for row in queryset)
+
+
+def test_values_list_fruits_foreign_key_id(client, db_fixture, optimized_querysets):
+    """Test that a forward FK id column is evaluated with `values_list`."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            colorId
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['colorId'] for fruit in fruits} == set(Fruit.objects.values_list('color_id', flat=True))
+    queryset, = optimized_querysets
+    assert not any(isinstance(row, Fruit) for row in queryset)
+
+
+def test_values_list_fruits_with_relation(client, db_fixture, optimized_querysets):
+    """Test that a list query with a FK relation falls back to `select_related`."""
+    fruit_count, _ = db_fixture
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            name
+            color {
+                id
+                name
+            }
+        }
+    }
+    """
+    with CaptureQueriesContext(connection):
+        response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+        fruits = response.json()['data']['valuesListFruits']
+        assert len(fruits) == fruit_count
+        assert all(fruit['color']['name'] for fruit in fruits)
+        assert len(connection.queries) == 1
+    assert_values_list_fallback(response, optimized_querysets)
+    queryset, = optimized_querysets
+    assert queryset.query.select_related == {'color': {}}
+
+
+def test_values_list_fruits_with_file(client, db_fixture, optimized_querysets):
+    """Test that a list query with a file field falls back to model instances."""
+    Fruit.objects.update(picture='fruits/fruit.jpg')
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            picture {
+                name
+            }
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['picture']['name'] for fruit in fruits} == {'fruits/fruit.jpg'}
+
+
+def test_values_list_fruits_with_resolver(client, db_fixture, optimized_querysets):
+    """Test that a custom resolver for a model column falls back to model instances."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            origin
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['origin'] for fruit in fruits} == {'Europe'}
+
+
+def test_values_list_fruits_with_resolver_hints(client, db_fixture, optimized_querysets):
+    """Test that a field with `resolver_hints` falls back to model instances."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            nameDisplay
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert all(fruit['nameDisplay'].startswith('My name is: ') for fruit in fruits)
+    queryset, = optimized_querysets
+    assert set(queryset.query.deferred_loading[0]) == {'id', 'name'}
+
+
+def test_values_list_fruits_with_inline_fragment(client, db_fixture, optimized_querysets):
+    """Test that a list query with an inline fragment falls back to model instances."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            ... on Fruit {
+                name
+            }
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['name'] for fruit in fruits} == set(Fruit.objects.values_list('name', flat=True))
+
+
+def test_values_list_fruits_with_renamed_field(client, db_fixture, optimized_querysets):
+    """Test that a field with a custom GraphQL name falls back to model instances."""
+    Fruit.objects.update(weight=100)
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            mass
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['mass'] for fruit in fruits} == {100}
+
+
+def test_values_list_fruits_with_field_name(client, db_fixture, optimized_querysets):
+    """Test that a field resolved from a different model field falls back to model instances."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            label
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['label'] for fruit in fruits} == set(Fruit.objects.values_list('name', flat=True))
+
+
+def test_values_list_fruits_with_alias(client, db_fixture, optimized_querysets):
+    """Test that an aliased selection falls back to model instances."""
+    query = """
+    query Fruits {
+        valuesListFruits {
+            id
+            fruitName: name
+        }
+    }
+    """
+    response = client.post('/graphql/', json.dumps({'query': query}), content_type='application/json')
+    assert_values_list_fallback(response, optimized_querysets)
+    fruits = response.json()['data']['valuesListFruits']
+    assert {fruit['fruitName'] for fruit in fruits} == set(Fruit.objects.values_list('name', flat=True))